@@ -20,6 +20,7 @@ import os
 folder = os.path.dirname(__file__)
 st_data_file = os.path.join(folder, 'state_scenarios_for_import.xlsx')
 st_data = pd.read_excel(st_data_file, index_col=[0])
+state_data = st_data.to_dict('index') # Plain dictionaries for fast access by state
 results_folder = os.path.join(folder, 'results')
 
 # Model for state specific analysis ===========================================
@@ -176,8 +177,26 @@ def create_states_model(biorefinery):
     else:
         tea.jobs_50 = 50 # assumption made by Humbird (2011) and Huang (2016)
 
+    # Incentives modeled for each state (see incentives_info.xlsx)
+    state_incentives = {
+        'Alabama': (7,),
+        'Colorado': (8,),
+        'Hawaii': (9,),
+        'Iowa': (1,10,18),
+        'Kansas': (2,),
+        'Kentucky': (11,19) if biorefinery == 'sugarcane' else (11,12,19),
+        'Louisiana': (13,),
+        'Montana': (3,20) if biorefinery == 'corn' else (3,),
+        'Nebraska': (4,),
+        'New Mexico': (6,),
+        'Oregon': (5,),
+        'South Carolina': (14,15),
+        'Utah': (16,),
+        'Virginia': (17,),
+    }
+
     def get_state_incentives(state):
-            avail_incentives = st_data.loc[state]['Incentives Available']
+            avail_incentives = state_data[state]['Incentives Available']
             avail_incentives = None if pd.isna(avail_incentives) else avail_incentives # no incentives
             if avail_incentives is not None:
                 try: # multiple incentives
@@ -193,142 +212,80 @@ def create_states_model(biorefinery):
             MFSP = tea.solve_price([tea.ethanol_product], [4])
         return 2.98668849 * MFSP
 
-    def MFSP_getter(state):
+    # TEA attributes set by the state MFSP metrics (restored after each evaluation)
+    state_settings = (
+         'state_income_tax',
+         'property_tax',
+         'fuel_tax',
+         'sales_tax',
+         'F_investment',
+         'state_tax_by_gross_receipts',
+         'deduct_federal_income_tax_to_state_taxable_earnings',
+         'deduct_half_federal_income_tax_to_state_taxable_earnings',
+         'incentive_numbers',
+    )
+
+    def get_state_settings(state):
+        row = state_data[state] # State data is fixed for each getter
+        return (float(row['Income Tax Rate (decimal)']),
+                float(row['Property Tax Rate (decimal)']),
+                float(row['State Motor Fuel Tax (decimal)']),
+                float(row['State Sales Tax Rate (decimal)']),
+                float(row['Electricity Price (USD/kWh)']),
+                float(row['Location Capital Cost Factor (dimensionless)']),
+                float(row[f'{name} Price (USD/kg)']),
+                state in ('Ohio', 'Texas'),
+                state in ('Alabama', 'Louisiana'),
+                state in ('Iowa', 'Missouri'))
+
+    def create_MFSP(state, incentive_numbers):
+        (state_income_tax, property_tax, fuel_tax, sales_tax, electricity_price,
+         F_investment, feedstock_price, state_tax_by_gross_receipts,
+         deduct_federal_income_tax, deduct_half_federal_income_tax) = get_state_settings(state)
+        feedstock = tea.feedstock
+        PowerUtility = bst.PowerUtility
         def MFSP():
-            names = (
-                 'state_income_tax',
-                 'property_tax',
-                 'fuel_tax',
-                 'sales_tax',
-                 'F_investment',
-                 'state_tax_by_gross_receipts',
-                 'deduct_federal_income_tax_to_state_taxable_earnings',
-                 'deduct_half_federal_income_tax_to_state_taxable_earnings',
-                 'incentive_numbers',
-             )
-            original_feedstock_price = tea.feedstock.price
-            original_electricity_price = bst.PowerUtility.price
-            dct = {i: getattr(tea, i) for i in names}
-            tea.state_income_tax = st_data.loc[state]['Income Tax Rate (decimal)']
-            tea.property_tax = st_data.loc[state]['Property Tax Rate (decimal)']
-            tea.fuel_tax = st_data.loc[state]['State Motor Fuel Tax (decimal)']
-            tea.sales_tax = st_data.loc[state]['State Sales Tax Rate (decimal)']
-            bst.PowerUtility.price = st_data.loc[state]['Electricity Price (USD/kWh)']
-            tea.F_investment = st_data.loc[state]['Location Capital Cost Factor (dimensionless)']
-            tea.incentive_numbers = ()
-            tea.feedstock.price = st_data.loc[state][f'{name} Price (USD/kg)']
-
-            if state == 'Ohio' or state == 'Texas':
-                tea.state_tax_by_gross_receipts = True
-            else:
-                tea.state_tax_by_gross_receipts = False
-
-            if state == 'Alabama' or state == 'Louisiana':
-                tea.deduct_federal_income_tax_to_state_taxable_earnings = True
-            else:
-                tea.deduct_federal_income_tax_to_state_taxable_earnings = False
-
-            if state == 'Iowa' or state == 'Missouri':
-                tea.deduct_half_federal_income_tax_to_state_taxable_earnings = True
-            else:
-                tea.deduct_half_federal_income_tax_to_state_taxable_earnings = False
+            original_feedstock_price = feedstock.price
+            original_electricity_price = PowerUtility.price
+            dct = {i: getattr(tea, i) for i in state_settings}
+            tea.state_income_tax = state_income_tax
+            tea.property_tax = property_tax
+            tea.fuel_tax = fuel_tax
+            tea.sales_tax = sales_tax
+            PowerUtility.price = electricity_price
+            tea.F_investment = F_investment
+            feedstock.price = feedstock_price
+
+            tea.state_tax_by_gross_receipts = state_tax_by_gross_receipts
+            tea.deduct_federal_income_tax_to_state_taxable_earnings = deduct_federal_income_tax
+            tea.deduct_half_federal_income_tax_to_state_taxable_earnings = deduct_half_federal_income_tax
+
+            if incentive_numbers is not None: # None keeps the current incentives
+                tea.incentive_numbers = incentive_numbers
 
             MFSP = solve_price()
-            tea.feedstock.price = original_feedstock_price
-            bst.PowerUtility.price = original_electricity_price
-            for i in names: setattr(tea, i, dct[i])
+            feedstock.price = original_feedstock_price
+            PowerUtility.price = original_electricity_price
+            for i in state_settings: setattr(tea, i, dct[i])
             return MFSP
         return MFSP
 
-    def MFSP_w_inc_getter(state):
-        def MFSP():
-            names = (
-                 'state_income_tax',
-                 'property_tax',
-                 'fuel_tax',
-                 'sales_tax',
-                 'F_investment',
-                 'state_tax_by_gross_receipts',
-                 'deduct_federal_income_tax_to_state_taxable_earnings',
-                 'deduct_half_federal_income_tax_to_state_taxable_earnings',
-                 'incentive_numbers',
-             )
-            original_feedstock_price = tea.feedstock.price
-            original_electricity_price = bst.PowerUtility.price
-            dct = {i: getattr(tea, i) for i in names}
-            tea.state_income_tax = st_data.loc[state]['Income Tax Rate (decimal)']
-            tea.property_tax = st_data.loc[state]['Property Tax Rate (decimal)']
-            tea.fuel_tax = st_data.loc[state]['State Motor Fuel Tax (decimal)']
-            tea.sales_tax = st_data.loc[state]['State Sales Tax Rate (decimal)']
-            bst.PowerUtility.price = st_data.loc[state]['Electricity Price (USD/kWh)']
-            tea.F_investment = st_data.loc[state]['Location Capital Cost Factor (dimensionless)']
-            # tea.incentive_numbers = get_state_incentives(state)
-            tea.feedstock.price = st_data.loc[state][f'{name} Price (USD/kg)']
-
-            if state == 'Ohio' or state == 'Texas':
-                tea.state_tax_by_gross_receipts = True
-            else:
-                tea.state_tax_by_gross_receipts = False
-
-            if state == 'Alabama' or state == 'Louisiana':
-                tea.deduct_federal_income_tax_to_state_taxable_earnings = True
-            else:
-                tea.deduct_federal_income_tax_to_state_taxable_earnings = False
-
-            if state == 'Iowa' or state == 'Missouri':
-                tea.deduct_half_federal_income_tax_to_state_taxable_earnings = True
-            else:
-                tea.deduct_half_federal_income_tax_to_state_taxable_earnings = False
-
-            if state == 'Alabama':
-                tea.incentive_numbers = (7,)
-            elif state == 'Colorado':
-                tea.incentive_numbers = (8,)
-            elif state == 'Hawaii':
-                tea.incentive_numbers = (9,)
-            elif state == 'Iowa':
-                tea.incentive_numbers = (1,10,18)
-            elif state == 'Kansas':
-                tea.incentive_numbers = (2,)
-            elif state == 'Kentucky':
-                if biorefinery == 'sugarcane':
-                    tea.incentive_numbers = (11,19)
-                else:
-                    tea.incentive_numbers = (11,12,19)
-            elif state == 'Louisiana':
-                tea.incentive_numbers = (13,)
-            elif state == 'Montana':
-                if biorefinery == 'corn':
-                    tea.incentive_numbers = (3,20)
-                else:
-                    tea.incentive_numbers = (3,)
-            elif state == 'Nebraska':
-                tea.incentive_numbers = (4,)
-            elif state == 'New Mexico':
-                tea.incentive_numbers = (6,)
-            elif state == 'Oregon':
-                tea.incentive_numbers = (5,)
-            elif state == 'South Carolina':
-                tea.incentive_numbers = (14,15)
-            elif state == 'Utah':
-                tea.incentive_numbers = (16,)
-            elif state == 'Virginia':
-                tea.incentive_numbers = (17,)
+    def MFSP_getter(state):
+        return create_MFSP(state, ())
 
-            MFSP = solve_price()
-            tea.feedstock.price = original_feedstock_price
-            bst.PowerUtility.price = original_electricity_price
-            for i in names: setattr(tea, i, dct[i])
-            return MFSP
-        return MFSP
+    def MFSP_w_inc_getter(state):
+        return create_MFSP(state, state_incentives.get(state))
 
     @model.metric(name='Utility cost', units='10^6 USD/yr')
     def get_utility_cost():
         return tea.utility_cost / 1e6
 
+    units = tuple(tea.system.units)
     @model.metric(name='Net electricity production', units='MWh/yr')
     def get_electricity_production():
-        return sum(i.power_utility.rate for i in tea.system.units) * tea.operating_hours/1000
+        rate = 0.
+        for i in units: rate += i.power_utility.rate
+        return rate * tea.operating_hours/1000
 
     @model.metric(name='Ethanol production', units='gal/yr')
     def get_ethanol_production():
@@ -617,9 +574,12 @@ def create_IPs_model(biorefinery):
     def get_utility_cost():
         return tea.utility_cost / 1e6
 
+    units = tuple(tea.system.units)
     @model.metric(name='Net electricity production', units='MWh/yr')
     def get_electricity_production():
-        return sum(i.power_utility.rate for i in tea.system.units) * tea.operating_hours/1000
+        rate = 0.
+        for i in units: rate += i.power_utility.rate
+        return rate * tea.operating_hours/1000
 
     @model.metric(name='Ethanol production', units='gal/yr')
     def get_ethanol_production():
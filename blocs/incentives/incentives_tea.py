@@ -146,19 +146,20 @@ def create_incentivized_tea(
     st_data_file = os.path.join(folder, 'state_scenarios_for_import.xlsx')
     st_data = pd.read_excel(st_data_file, index_col=[0])
     if state:
-        tea.state_income_tax = st_data.loc[state]['Income Tax Rate (decimal)']
-        tea.property_tax = st_data.loc[state]['Property Tax Rate (decimal)']
-        tea.fuel_tax = st_data.loc[state]['State Motor Fuel Tax (decimal)']
-        tea.sales_tax = st_data.loc[state]['State Sales Tax Rate (decimal)']
-        bst.PowerUtility.price = st_data.loc[state]['Electricity Price (USD/kWh)']
-        tea.F_investment = st_data.loc[state]['Location Capital Cost Factor (dimensionless)']
+        row = st_data.loc[state]
+        tea.state_income_tax = row['Income Tax Rate (decimal)']
+        tea.property_tax = row['Property Tax Rate (decimal)']
+        tea.fuel_tax = row['State Motor Fuel Tax (decimal)']
+        tea.sales_tax = row['State Sales Tax Rate (decimal)']
+        bst.PowerUtility.price = row['Electricity Price (USD/kWh)']
+        tea.F_investment = row['Location Capital Cost Factor (dimensionless)']
         if feedstock.ID == 'corn':
             name = 'CN'
         elif feedstock.ID == 'sugarcane':
             name = 'SC'
         elif feedstock.ID == 'cornstover':
             name = 'CS'
-        tea.feedstock.price = st_data.loc[state][f'{name} Price (USD/kg)']
+        tea.feedstock.price = row[f'{name} Price (USD/kg)']
     return tea
 
 class CellulosicIncentivesTEA(cs.CellulosicEthanolTEA):
@@ -213,7 +214,7 @@ class CellulosicIncentivesTEA(cs.CellulosicEthanolTEA):
         return FCI
 
     def _fill_tax_and_incentives(self, incentives, taxable_cashflow, nontaxable_cashflow, tax, depreciation):
-        taxable_cashflow[taxable_cashflow < 0.] = 0.
+        np.maximum(taxable_cashflow, 0., out=taxable_cashflow)
         lang_factor = self.lang_factor
         if lang_factor:
             converyor_costs = lang_factor * sum([i.purchase_cost for i in self.units if isinstance(i, bst.ConveyingBelt)])
@@ -303,7 +304,7 @@ class CellulosicIncentivesTEA(cs.CellulosicEthanolTEA):
             state_assessed_income_tax = revenue_arr * self.state_income_tax
         else:
             state_assessed_income_tax = taxable_cashflow * self.state_income_tax
-        exemptions, deductions, credits, refunds = blc.determine_tax_incentives(
+        tax_incentives = blc.determine_tax_incentives(
             self.incentive_numbers,
             start=self._start,
             plant_years=self._years + self._start,
@@ -330,10 +331,7 @@ class CellulosicIncentivesTEA(cs.CellulosicEthanolTEA):
             building_mats=purchase_cost_arr,
             NM_value=elec_eq + feedstock_value_arr,
         )
-        self.exemptions = exemptions
-        self.deductions = deductions
-        self.credits = credits
-        self.refunds = refunds
+        self.exemptions, self.deductions, self.credits, self.refunds = tax_incentives
         index = taxable_cashflow > 0.
         tax[:] = property_tax_arr + fuel_tax_arr + sales_tax_arr # util_tax_arr; utility tax not currently considered
         tax[index] += federal_assessed_income_tax[index]
@@ -341,10 +339,8 @@ class CellulosicIncentivesTEA(cs.CellulosicEthanolTEA):
             tax[:] += state_assessed_income_tax
         else:
             tax[index] += state_assessed_income_tax[index]
-        maximum_incentives = credits + refunds + deductions + exemptions
-        index = maximum_incentives > tax
-        maximum_incentives[index] = tax[index]
-        incentives[:] = maximum_incentives
+        maximum_incentives = tax_incentives.sum(axis=0)
+        np.minimum(maximum_incentives, tax, out=incentives)
 
 class ConventionalIncentivesTEA(sc.ConventionalEthanolTEA):
 
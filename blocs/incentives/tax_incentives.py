@@ -10,7 +10,7 @@ Authors: Dalton Stewart (dalton.w.stewart@gmail.com)
 """
 
 import numpy as np
-from inspect import signature
+from numba import njit
 
 __all__ = (
     'EXEMPTIONS',
@@ -29,48 +29,290 @@ DEDUCTIONS = set(range(6, 7))
 CREDITS = set(range(7, 18))
 REFUNDS = set(range(18, 21))
 
+_EXEMPTION_HANDLERS = {}
+_DEDUCTION_HANDLERS = {}
+_CREDIT_HANDLERS = {}
+_REFUND_HANDLERS = {}
+
 def check_missing_parameter(p, name):
     if p is None: raise ValueError(f"missing parameter '{name}'")
 
 def check_any_missing_parameter(dct, names):
-    for i in names: check_missing_parameter(dct[i], i)
+    for i in names: check_missing_parameter(dct.get(i), i)
+
+def register_incentive(handlers, incentive_number, params):
+    """
+    Return decorator that registers a function to compute an incentive.
+    Function must have signature
+    f(incentive, plant_years, start, *params) -> 1d array, where params
+    are the names of the required parameters. The incentive array is
+    filled in place and returned.
+    
+    """
+    def register(f):
+        f.params = params
+        handlers[incentive_number] = f
+        return f
+    return register
+
+def check_incentive_parameters(handlers, incentive_numbers, kwargs):
+    for i in incentive_numbers:
+        if i in handlers: check_any_missing_parameter(kwargs, handlers[i].params)
+
+def compute_incentive(handlers, incentive_number, plant_years, start, kwargs, incentive=None):
+    # Parameters are assumed to be checked beforehand
+    if incentive is None: incentive = np.zeros(plant_years, dtype=np.float64)
+    if incentive_number not in handlers: return incentive
+    f = handlers[incentive_number]
+    return f(incentive, plant_years, start, *[kwargs[i] for i in f.params])
+
+def _fill_incentives(row, handlers, nums, plant_years, start, kwargs):
+    # Add incentives to row (a view of the array returned by determine_tax_incentives)
+    if not nums: return
+    # The first incentive is computed directly in the row
+    compute_incentive(handlers, nums[0], plant_years, start, kwargs, row)
+    for i in nums[1:]:
+        incentive = compute_incentive(handlers, i, plant_years, start, kwargs)
+        np.add(row, incentive, out=row)
+
+def dispatch_incentive(handlers, params, incentive_number, plant_years, start, kwargs):
+    for i in kwargs:
+        if i not in params: raise TypeError(f"unexpected keyword argument '{i}'")
+    check_incentive_parameters(handlers, (incentive_number,), kwargs)
+    return compute_incentive(handlers, incentive_number, plant_years, start, kwargs)
         
-def assess_incentive(start, duration, plant_years, incentive, amount, assessed_tax, ub=None):
-    start = max(start, assessed_tax.argmax())
-    if start + duration > plant_years: start = plant_years - duration
-    incentive[start: start + duration] = amount
-    if ub is not None: incentive[incentive > ub] = ub
-    incentive = np.where( 
-        incentive > assessed_tax,
-        assessed_tax,
-        incentive
-    )
-    assessed_tax -= incentive
+# %% Incentive assessment kernels
+
+@njit(cache=True)
+def _incentive_start(start, duration, plant_years, assessed_tax):
+    # The argmax cannot be cached across incentives; each incentive reduces
+    # the assessed tax in place, so the year with the largest tax may change
+    amax = assessed_tax.argmax()
+    return min(max(start, amax), plant_years - duration)
+
+@njit(cache=True)
+def _slice_bounds(start, stop, size):
+    # Same bounds as a Python slice [start: stop] of an array of given size
+    if start < 0: start = max(start + size, 0)
+    elif start > size: start = size
+    if stop < 0: stop = max(stop + size, 0)
+    elif stop > size: stop = size
+    if stop < start: stop = start
+    return start, stop
+
+@njit(cache=True)
+def _cap_and_clip(x, cap, assessed_tax):
+    if x > cap: x = cap
+    if x > assessed_tax: x = assessed_tax
+    return x
+
+@njit(cache=True)
+def _assess_incentive(start, duration, plant_years, incentive, amount, assessed_tax, ub):
+    start = _incentive_start(start, duration, plant_years, assessed_tax)
+    lb, hb = _slice_bounds(start, start + duration, incentive.size)
+    for i in range(incentive.size):
+        x = amount if lb <= i < hb else incentive[i]
+        x = _cap_and_clip(x, ub, assessed_tax[i])
+        incentive[i] = x
+        assessed_tax[i] -= x
     return incentive
 
-def assess_incentive_arr(start, duration, plant_years, incentive, amount, assessed_tax, ub=None):
-    start = max(start, assessed_tax.argmax())
-    if start + duration > plant_years: start = plant_years - duration
-    incentive[start: start + duration] = amount[start: start + duration]
-    if ub is not None: incentive[incentive > ub] = ub
-    incentive = np.where( 
-        incentive > assessed_tax,
-        assessed_tax,
-        incentive
-    )
-    assessed_tax -= incentive
+@njit(cache=True)
+def _assess_incentive_amounts(incentive, lb, hb, amount, offset, step, assessed_tax, ub):
+    # Amount of year i within [lb, hb) is amount[offset + step * (i - lb)]
+    for i in range(incentive.size):
+        x = amount[offset + step * (i - lb)] if lb <= i < hb else incentive[i]
+        x = _cap_and_clip(x, ub, assessed_tax[i])
+        incentive[i] = x
+        assessed_tax[i] -= x
     return incentive
+
+@njit(cache=True)
+def _assess_incentive_window(start, duration, plant_years, incentive, amount, assessed_tax, ub):
+    # Amount is given only for the years within the incentive duration
+    start = _incentive_start(start, duration, plant_years, assessed_tax)
+    lb, hb = _slice_bounds(start, start + duration, incentive.size)
+    size = amount.size
+    if size == 1:
+        step = 0
+    elif size == hb - lb:
+        step = 1
+    else:
+        raise ValueError('incentive amount does not match incentive duration')
+    return _assess_incentive_amounts(incentive, lb, hb, amount, 0, step, assessed_tax, ub)
+
+@njit(cache=True)
+def _assess_incentive_arr(start, duration, plant_years, incentive, amount, assessed_tax, ub):
+    # Amount is given for all years
+    start = _incentive_start(start, duration, plant_years, assessed_tax)
+    stop = start + duration
+    lb, hb = _slice_bounds(start, stop, incentive.size)
+    alb, ahb = _slice_bounds(start, stop, amount.size)
+    size = ahb - alb
+    if size == 1:
+        step = 0
+    elif size == hb - lb:
+        step = 1
+    else:
+        raise ValueError('incentive amount does not match incentive duration')
+    return _assess_incentive_amounts(incentive, lb, hb, amount, alb, step, assessed_tax, ub)
+
+def assess_incentive(start, duration, plant_years, incentive, amount, assessed_tax, ub=None):
+    if ub is None: ub = np.inf
+    if isinstance(amount, np.ndarray):
+        return _assess_incentive_window(start, duration, plant_years, incentive, amount, assessed_tax, ub)
+    else:
+        return _assess_incentive(start, duration, plant_years, incentive, amount, assessed_tax, ub)
+
+def assess_incentive_arr(start, duration, plant_years, incentive, amount, assessed_tax, ub=None):
+    if ub is None: ub = np.inf
+    return _assess_incentive_arr(start, duration, plant_years, incentive, amount, assessed_tax, ub)
+
+# %% Exemptions
+
+@register_incentive(_EXEMPTION_HANDLERS, 1, ('value_added', 'property_taxable_value', 'property_tax_rate'))
+def _exemption_1(exemption, plant_years, start, value_added, property_taxable_value, property_tax_rate):
+    exemption_amount = value_added # Value added to property, assume FCI
+    duration = 20
+    exemption[start: start + duration] = exemption_amount
+    exemption = assess_incentive(start, duration, plant_years, exemption, exemption_amount, property_taxable_value)
+    exemption *= property_tax_rate
+    return exemption
+
+@register_incentive(_EXEMPTION_HANDLERS, 2, ('property_taxable_value', 'property_tax_rate'))
+def _exemption_2(exemption, plant_years, start, property_taxable_value, property_tax_rate):
+    duration = 10
+    exemption = assess_incentive_arr(start, duration, plant_years, exemption, property_taxable_value, property_taxable_value)       
+    exemption *= property_tax_rate # Exempt amount is the entire amount of state property tax assessed
+    return exemption
+
+@register_incentive(_EXEMPTION_HANDLERS, 3, ('ethanol_eq', 'property_taxable_value', 'property_tax_rate'))
+def _exemption_3(exemption, plant_years, start, ethanol_eq, property_taxable_value, property_tax_rate):
+    duration = 10
+    exemption = assess_incentive_arr(start, duration, plant_years, exemption, ethanol_eq, property_taxable_value)
+    exemption *= property_tax_rate
+    return exemption
+
+@register_incentive(_EXEMPTION_HANDLERS, 4, ('fuel_taxable_value', 'fuel_tax_rate'))
+def _exemption_4(exemption, plant_years, start, fuel_taxable_value, fuel_tax_rate):
+    duration = plant_years
+    exemption = assess_incentive_arr(start, duration, plant_years, exemption, fuel_taxable_value, fuel_taxable_value)   
+    exemption *= fuel_tax_rate # Exempt amount is the entire amount of state fuel tax assessed
+    return exemption
+
+@register_incentive(_EXEMPTION_HANDLERS, 5, ('property_taxable_value', 'property_tax_rate'))
+def _exemption_5(exemption, plant_years, start, property_taxable_value, property_tax_rate):
+    duration = plant_years
+    exemption = assess_incentive_arr(start, duration, plant_years, exemption, property_taxable_value, property_taxable_value)       
+    exemption *= property_tax_rate # Exempt amount is the entire amount of state property tax assessed
+    return exemption
+
+# %% Deductions
+
+@register_incentive(_DEDUCTION_HANDLERS, 6, ('NM_value', 'sales_taxable_value', 'sales_tax_rate'))
+def _deduction_6(deduction, plant_years, start, NM_value, sales_taxable_value, sales_tax_rate):
+    duration = plant_years
+    deduction = assess_incentive_arr(start, duration, plant_years, deduction, NM_value, sales_taxable_value)       
+    deduction *= sales_tax_rate
+    return deduction
+
+# %% Credits
+
+@register_incentive(_CREDIT_HANDLERS, 7, ('TCI', 'state_income_tax_assessed'))
+def _credit_7(credit, plant_years, start, TCI, state_income_tax_assessed):
+    # Actually 'qualified capital investment', assume TCI; DON'T MULTIPLY BY TAX RATE HERE
+    duration = 10
+    return assess_incentive(start, duration, plant_years, credit, 0.015 * TCI, state_income_tax_assessed)
+
+@register_incentive(_CREDIT_HANDLERS, 8, ('TCI', 'state_income_tax_assessed'))
+def _credit_8(credit, plant_years, start, TCI, state_income_tax_assessed):
+    # actually 'qualified investment', assume TCI; DON'T MULTIPLY BY TAX RATE HERE
+    duration = 22
+    return assess_incentive(start, duration, plant_years, credit, 0.03 * TCI, state_income_tax_assessed, 7.5e5)
+
+@register_incentive(_CREDIT_HANDLERS, 9, ('ethanol', 'state_income_tax_assessed'))
+def _credit_9(credit, plant_years, start, ethanol, state_income_tax_assessed):
+    # Fuel content of ethanol is 76100 btu/gal; DON'T MULTIPLY BY TAX RATE HERE
+    duration = 5
+    return assess_incentive_arr(start, duration, plant_years, credit, 76100 * 0.2 / 76000 * ethanol, state_income_tax_assessed, 3e6)
+
+@register_incentive(_CREDIT_HANDLERS, 10, ('TCI', 'state_income_tax_assessed'))
+def _credit_10(credit, plant_years, start, TCI, state_income_tax_assessed):
+    # actually just 'a percentage of qualifying investment', assume 5% of TCI, no max specified but may be inaccurate; DON'T MULTIPLY BY TAX RATE HERE
+    duration = 5
+    return assess_incentive(start, duration, plant_years, credit, (0.05 * TCI)/duration, state_income_tax_assessed)
+
+@register_incentive(_CREDIT_HANDLERS, 11, ('state_income_tax_assessed',))
+def _credit_11(credit, plant_years, start, state_income_tax_assessed):
+    duration = 15      
+    return assess_incentive_arr(start, duration, plant_years, credit, state_income_tax_assessed, state_income_tax_assessed) # Credit amount is the entire amount of state income tax assessed
+
+@register_incentive(_CREDIT_HANDLERS, 12, ('ethanol', 'state_income_tax_assessed'))
+def _credit_12(credit, plant_years, start, ethanol, state_income_tax_assessed):
+    duration = plant_years
+    return assess_incentive_arr(start, duration, plant_years, credit, ethanol, state_income_tax_assessed, 5e6)
+
+@register_incentive(_CREDIT_HANDLERS, 13, ('TCI', 'state_income_tax_assessed'))
+def _credit_13(credit, plant_years, start, TCI, state_income_tax_assessed):
+    if TCI < 1e5:
+        credit_amount = 0
+    if TCI <= 3e5:
+        credit_amount = 0.07 * TCI
+    elif TCI <= 1e6:
+        credit_amount = 0.14 * TCI
+    else:
+        credit_amount = 0.18 * TCI
+    # There are other provisions to the incentive but they are more difficult to model so I will assume the maximum value is achieved via these provisions; DON'T MULTIPLY BY TAX RATE HERE
+    duration = 2 # Estimated, incentive description is not clear
+    return assess_incentive(start, duration, plant_years, credit, credit_amount, state_income_tax_assessed, 1e6)
+
+@register_incentive(_CREDIT_HANDLERS, 14, ('TCI', 'property_tax_assessed'))
+def _credit_14(credit, plant_years, start, TCI, property_tax_assessed):
+    total_credit = 0.25 * TCI # Actually cost of constructing and equipping facility; DON'T MULTIPLY BY TAX RATE HERE
+    duration = 7
+    credit_amount = total_credit/duration #credit must be taken in equal installments over duration
+    return assess_incentive(start, duration, plant_years, credit, credit_amount, property_tax_assessed)
+
+@register_incentive(_CREDIT_HANDLERS, 15, ('elec_eq', 'state_income_tax_assessed'))
+def _credit_15(credit, plant_years, start, elec_eq, state_income_tax_assessed):
+    duration = 15
+    credit_amount = 0.25 * elec_eq[start: start + duration] # DON'T MULTIPLY BY TAX RATE HERE
+    return assess_incentive(start, duration, plant_years, credit, credit_amount, state_income_tax_assessed, 6.5e5)
+
+@register_incentive(_CREDIT_HANDLERS, 16, ('state_income_tax_assessed',))
+def _credit_16(credit, plant_years, start, state_income_tax_assessed):
+    duration = 20
+    credit_amount = 0.75 * state_income_tax_assessed[start: start + duration] # Credit amount depends on amount of state income tax assessed; DON'T MULTIPLY BY TAX RATE HERE
+    return assess_incentive(start, duration, plant_years, credit, credit_amount, state_income_tax_assessed)
+
+@register_incentive(_CREDIT_HANDLERS, 17, ('jobs_50', 'state_income_tax_assessed'))
+def _credit_17(credit, plant_years, start, jobs_50, state_income_tax_assessed):
+    credit_amount = 500 * jobs_50 # Number of jobs paying 50k+/year; DON'T MULTIPLY BY TAX RATE HERE
+    duration = 5
+    return assess_incentive(start, duration, plant_years, credit, credit_amount, state_income_tax_assessed, 1.75e5)
+
+# %% Refunds
+
+@register_incentive(_REFUND_HANDLERS, 18, ('IA_value', 'sales_tax_rate', 'sales_tax_assessed'))
+def _refund_18(refund, plant_years, start, IA_value, sales_tax_rate, sales_tax_assessed):
+    duration = 1
+    refund_amount = sales_tax_rate * IA_value # Fees paid to (sub)contractors + cost of racks, shelving, conveyors
+    return assess_incentive_arr(start, duration, plant_years, refund, refund_amount, sales_tax_assessed)
+
+@register_incentive(_REFUND_HANDLERS, 19, ('building_mats', 'sales_tax_rate', 'sales_tax_assessed'))
+def _refund_19(refund, plant_years, start, building_mats, sales_tax_rate, sales_tax_assessed):
+    duration = 1
+    refund_amount = sales_tax_rate * building_mats # Cost of building and construction materials
+    return assess_incentive_arr(start, duration, plant_years, refund, refund_amount, sales_tax_assessed)
+
+@register_incentive(_REFUND_HANDLERS, 20, ('ethanol', 'state_income_tax_assessed'))
+def _refund_20(refund, plant_years, start, ethanol, state_income_tax_assessed):
+    duration = plant_years
+    return assess_incentive_arr(start, duration, plant_years, refund, 0.2 * ethanol, state_income_tax_assessed, 6e6) # DON'T MULTIPLY BY TAX RATE HERE
+
+# %% Incentive amounts
     
-def determine_exemption_amount(incentive_number,
-                               plant_years,
-                               property_taxable_value=None,
-                               property_tax_rate=None,
-                               value_added=None,
-                               biodiesel_eq=None,
-                               ethanol_eq=None,
-                               fuel_taxable_value=None,
-                               fuel_tax_rate=None,
-                               start=0):
+def determine_exemption_amount(incentive_number, plant_years, start=0, **kwargs):
     """
     Return 1d array of tax exemptions per year.
     
@@ -80,6 +322,11 @@ def determine_exemption_amount(incentive_number,
         Incentive type.
     plant_years : int
         Number of years plant will operate.
+    start : int, optional
+        Year incentive starts. Defaults to 0.
+    
+    Other parameters
+    ----------------
     value_added : float, optional
         Value added to property [$]. Assume similar to FCI. 
     property_taxable_value : 1d array, optional 
@@ -94,52 +341,11 @@ def determine_exemption_amount(incentive_number,
         Amount of fuel on which fuel tax can be assessed [$/year].
     fuel_tax_rate : float, optional
         Fuel tax rate [-].
-    start : int, optional
-        Year incentive starts. Defaults to 0.
     
     """
-    lcs = locals()
-    exemption = np.zeros((plant_years,))
-    if incentive_number == 1:
-        params = ('value_added', 'property_taxable_value', 'property_tax_rate')
-        check_any_missing_parameter(lcs, params)
-        exemption_amount = value_added # Value added to property, assume FCI
-        duration = 20
-        exemption[start: start + duration] = exemption_amount
-        exemption = assess_incentive(start, duration, plant_years, exemption, exemption_amount, property_taxable_value)
-        exemption *= property_tax_rate
-    elif incentive_number == 2:
-        params = ('property_taxable_value', 'property_tax_rate')
-        check_any_missing_parameter(lcs, params)
-        duration = 10
-        exemption = assess_incentive_arr(start, duration, plant_years, exemption, property_taxable_value, property_taxable_value)       
-        exemption *= property_tax_rate # Exempt amount is the entire amount of state property tax assessed
-    elif incentive_number == 3:
-        params = ('ethanol_eq', 'property_taxable_value', 'property_tax_rate')
-        check_any_missing_parameter(lcs, params)
-        duration = 10
-        exemption = assess_incentive_arr(start, duration, plant_years, exemption, ethanol_eq, property_taxable_value)
-        exemption *= property_tax_rate        
-    elif incentive_number == 4:
-        params = ('fuel_tax_rate', 'property_taxable_value', 'property_tax_rate')
-        check_any_missing_parameter(lcs, params)
-        duration = plant_years
-        exemption = assess_incentive_arr(start, duration, plant_years, exemption, fuel_taxable_value, fuel_taxable_value)   
-        exemption *= fuel_tax_rate # Exempt amount is the entire amount of state fuel tax assessed       
-    elif incentive_number == 5:
-        params = ('fuel_tax_rate', 'property_taxable_value', 'property_tax_rate')
-        check_any_missing_parameter(lcs, params)
-        duration = plant_years
-        exemption = assess_incentive_arr(start, duration, plant_years, exemption, property_taxable_value, property_taxable_value)       
-        exemption *= property_tax_rate # Exempt amount is the entire amount of state property tax assessed   
-    return exemption
+    return dispatch_incentive(_EXEMPTION_HANDLERS, EXEMPTION_PARAMETERS_SET, incentive_number, plant_years, start, kwargs)
     
-def determine_deduction_amount(incentive_number,
-                               plant_years,
-                               NM_value=None,
-                               sales_taxable_value=None,
-                               sales_tax_rate=None,
-                               start=0):
+def determine_deduction_amount(incentive_number, plant_years, start=0, **kwargs):
     """
     Return 1d array of tax deductions per year.
     
@@ -149,6 +355,11 @@ def determine_deduction_amount(incentive_number,
         Incentive type.
     plant_years : int
         Number of years plant will operate.
+    start : int, optional
+        Year incentive starts. Defaults to 0.
+    
+    Other parameters
+    ----------------
     NM_value : 1d array, optional
         Value of biomass boiler, gasifier, furnace, turbine-generator, 
         storage facility, feedstock processing or drying equipment, feedstock 
@@ -158,31 +369,11 @@ def determine_deduction_amount(incentive_number,
         Value of purchases on which sales tax can be assessed [$/yr]
     sales_tax_rate : float, optional
         Sales tax rate [-].
-    start : int, optional
-        Year incentive starts. Defaults to 0.
+    
     """
-    lcs = locals()
-    deduction = np.zeros((plant_years,))
-    if incentive_number == 6:
-        params = ('NM_value', 'sales_taxable_value', 'sales_tax_rate')
-        check_any_missing_parameter(lcs, params)
-        duration = plant_years
-        deduction = assess_incentive_arr(start, duration, plant_years, deduction, NM_value, sales_taxable_value)       
-        deduction *= sales_tax_rate
-    return deduction
+    return dispatch_incentive(_DEDUCTION_HANDLERS, DEDUCTION_PARAMETERS_SET, incentive_number, plant_years, start, kwargs)
         
-def determine_credit_amount(incentive_number,
-                            plant_years,
-                            wages=None,
-                            TCI=None,
-                            ethanol=None,
-                            fed_income_tax_assessed=None,
-                            elec_eq=None,
-                            jobs_50=None,
-                            utility_tax_assessed=None,
-                            state_income_tax_assessed=None,
-                            property_tax_assessed=None,
-                            start=0):
+def determine_credit_amount(incentive_number, plant_years, start=0, **kwargs):
     """
     Return 1d array of tax credits as cash flows per year.
     
@@ -192,6 +383,11 @@ def determine_credit_amount(incentive_number,
         Incentive type.
     plant_years : int
         Number of years plant will operate.
+    start : int, optional
+        Year incentive starts. Defaults to 0.
+    
+    Other parameters
+    ----------------
     wages : 1d array, optional
         Employee wages [$/yr].
     TCI : float, optional
@@ -210,96 +406,11 @@ def determine_credit_amount(incentive_number,
         State income tax per year [$/yr]
     property_tax_assessed : 1d array, optional
         Property tax per year [$/yr]
-    start : int, optional
-        Year incentive starts. Defaults to 0.
         
     """
-    lcs = locals()
-    credit = np.zeros((plant_years,))
-    if incentive_number == 7:
-        params = ('TCI', 'state_income_tax_assessed')
-        check_any_missing_parameter(lcs, params)
-        # Actually 'qualified capital investment', assume TCI; DON'T MULTIPLY BY TAX RATE HERE
-        duration = 10
-        credit = assess_incentive(start, duration, plant_years, credit, 0.015 * TCI, state_income_tax_assessed)
-    elif incentive_number == 8:
-        params = ('TCI', 'state_income_tax_assessed')
-        check_any_missing_parameter(lcs, params)
-        # actually 'qualified investment', assume TCI; DON'T MULTIPLY BY TAX RATE HERE
-        duration = 22
-        credit = assess_incentive(start, duration, plant_years, credit, 0.03 * TCI, state_income_tax_assessed, 7.5e5)
-    elif incentive_number == 9:
-        params = ('ethanol', 'state_income_tax_assessed')
-        check_any_missing_parameter(lcs, params)
-        # Fuel content of ethanol is 76100 btu/gal; DON'T MULTIPLY BY TAX RATE HERE
-        duration = 5
-        credit = assess_incentive_arr(start, duration, plant_years, credit, 76100 * 0.2 / 76000 * ethanol, state_income_tax_assessed, 3e6)
-    elif incentive_number == 10:
-        params = ('TCI', 'state_income_tax_assessed')
-        check_any_missing_parameter(lcs, params)
-        total_credit = 0.05 * TCI # actually just 'a percentage of qualifying investment', assume 5% of TCI, no max specified but may be inaccurate; DON'T MULTIPLY BY TAX RATE HERE
-        duration = 5
-        credit = assess_incentive(start, duration, plant_years, credit, (0.05 * TCI)/duration, state_income_tax_assessed)
-    elif incentive_number == 11:
-        params = ('state_income_tax_assessed',)
-        check_any_missing_parameter(lcs, params)
-        duration = 15      
-        credit = assess_incentive_arr(start, duration, plant_years, credit, state_income_tax_assessed, state_income_tax_assessed)# Credit amount is the entire amount of state income tax assessed
-    elif incentive_number == 12:
-        params = ('ethanol', 'state_income_tax_assessed')
-        check_any_missing_parameter(lcs, params)
-        duration = plant_years
-        credit = assess_incentive_arr(start, duration, plant_years, credit, ethanol, state_income_tax_assessed,5e6)
-    elif incentive_number == 13:
-        params = ('TCI', 'state_income_tax_assessed')
-        check_any_missing_parameter(lcs, params)
-        if TCI < 1e5:
-            credit_amount = 0
-        if TCI <= 3e5:
-            credit_amount = 0.07 * TCI
-        elif TCI <= 1e6:
-            credit_amount = 0.14 * TCI
-        else:
-            credit_amount = 0.18 * TCI
-        # There are other provisions to the incentive but they are more difficult to model so I will assume the maximum value is achieved via these provisions; DON'T MULTIPLY BY TAX RATE HERE
-        duration = 2 # Estimated, incentive description is not clear
-        credit = assess_incentive(start, duration, plant_years, credit, credit_amount, state_income_tax_assessed, 1e6)
-    elif incentive_number == 14:
-        params = ('TCI', 'property_tax_assessed')
-        check_any_missing_parameter(lcs, params)
-        total_credit = 0.25 * TCI # Actually cost of constructing and equipping facility; DON'T MULTIPLY BY TAX RATE HERE
-        duration = 7
-        credit_amount = total_credit/duration #credit must be taken in equal installments over duration
-        credit = assess_incentive(start, duration, plant_years, credit, credit_amount, property_tax_assessed)
-    elif incentive_number == 15:
-        params = ('elec_eq', 'state_income_tax_assessed')
-        check_any_missing_parameter(lcs, params)
-        duration = 15
-        credit_amount = 0.25 * elec_eq[start: start + duration] # DON'T MULTIPLY BY TAX RATE HERE
-        credit = assess_incentive(start, duration, plant_years, credit, credit_amount, state_income_tax_assessed, 6.5e5)
-    elif incentive_number == 16:
-        params = ('state_income_tax_assessed',)
-        check_any_missing_parameter(lcs, params)
-        duration = 20
-        credit_amount = 0.75 * state_income_tax_assessed[start: start + duration]# Credit amount depends on amount of state income tax assessed; DON'T MULTIPLY BY TAX RATE HERE
-        credit = assess_incentive(start, duration, plant_years, credit, credit_amount, state_income_tax_assessed)
-    elif incentive_number == 17:
-        params = ('jobs_50', 'state_income_tax_assessed')
-        check_any_missing_parameter(lcs, params)
-        credit_amount = 500 * jobs_50 # Number of jobs paying 50k+/year; DON'T MULTIPLY BY TAX RATE HERE
-        duration = 5
-        credit = assess_incentive(start, duration, plant_years, credit, credit_amount, state_income_tax_assessed, 1.75e5)
-    return credit   
-
-def determine_refund_amount(incentive_number,
-                            plant_years,
-                            IA_value=None,
-                            building_mats=None,
-                            ethanol=None,
-                            sales_tax_rate=None,
-                            sales_tax_assessed=None,
-                            state_income_tax_assessed=None,
-                            start=0):
+    return dispatch_incentive(_CREDIT_HANDLERS, CREDIT_PARAMETERS_SET, incentive_number, plant_years, start, kwargs)
+
+def determine_refund_amount(incentive_number, plant_years, start=0, **kwargs):
     """
     Return 1d array of tax refunds as cash flows per year.
     
@@ -309,6 +420,11 @@ def determine_refund_amount(incentive_number,
         Incentive number.
     plant_years : int
         Number of years plant will operate.
+    start : int, optional
+        Year incentive starts. Defaults to 0.
+    
+    Other parameters
+    ----------------
     IA_value : 1d array, optional
         Fees paid to (sub)contractors + cost of racks, shelving, conveyors [$].
     building_mats : 1d array, optional
@@ -321,49 +437,29 @@ def determine_refund_amount(incentive_number,
         Sales tax per year [$/yr]
     state_income_tax_assessed : 1d array, optional
         State income tax per year [$/yr]
-    start : int, optional
-        Year incentive starts. Defaults to 0.
         
     """
-    lcs = locals()
-    refund = np.zeros((plant_years,))
-    if incentive_number == 18:
-        params = ('IA_value', 'sales_tax_rate')
-        check_any_missing_parameter(lcs, params)
-        duration = 1
-        refund_amount = sales_tax_rate * IA_value # Fees paid to (sub)contractors + cost of racks, shelving, conveyors
-        refund = assess_incentive_arr(start, duration, plant_years, refund, refund_amount, sales_tax_assessed)
-    elif incentive_number == 19:
-        params = ('building_mats', 'sales_tax_rate')
-        check_any_missing_parameter(lcs, params)
-        duration = 1
-        refund_amount = sales_tax_rate  * building_mats # Cost of building and construction materials
-        refund = assess_incentive_arr(start, duration, plant_years, refund, refund_amount, sales_tax_assessed)
-    elif incentive_number == 20:
-        params = ('ethanol', 'state_income_tax_assessed')
-        check_any_missing_parameter(lcs, params)
-        duration = plant_years
-        refund = assess_incentive_arr(start, duration, plant_years, refund, 0.2 * ethanol, state_income_tax_assessed,6e6)
-        #DON'T MULTIPLY BY TAX RATE HERE
-    return refund
+    return dispatch_incentive(_REFUND_HANDLERS, REFUND_PARAMETERS_SET, incentive_number, plant_years, start, kwargs)
         
 def determine_tax_incentives(incentive_numbers,
+                             plant_years,
+                             start=0,
                              **kwargs):
     """
-    Return a tuple of 1d arrays for tax exemptions, deductions, credits, and 
-    refunds.
+    Return a 2d array of tax exemptions, deductions, credits, and refunds
+    per year.
 
     Parameters
     ----------
     incentive_numbers : frozenset[int]
         Incentive types.
+    plant_years : int
+        Number of years plant will operate.
+    start : int, optional
+        Year incentive starts. Defaults to 0.
 
     Other parameters
     ----------------
-    start : int, optional
-        Year incentive starts. Defaults to 0.
-    plant_years : int
-        Number of years plant will operate.
     value_added : float, optional
         Value added to property [$]. Assume similar to FCI. 
     property_taxable_value : 1d array, optional 
@@ -419,10 +515,9 @@ def determine_tax_incentives(incentive_numbers,
 
     Returns
     -------
-    exemptions : 1d array
-    deductions : 1d array
-    credits : 1d array
-    refunds : 1d array
+    incentives : 2d array
+        Rows are exemptions, deductions, credits, and refunds. Each row
+        may be unpacked as a 1d array.
 
     """
     incentive_numbers = frozenset(incentive_numbers)
@@ -436,27 +531,27 @@ def determine_tax_incentives(incentive_numbers,
         elif i in CREDITS: credits.append(i)
         elif i in REFUNDS: refunds.append(i)
         else: raise ValueError(f"invalid incentive number '{i}'")
-    get_kwargs = lambda params: {i: kwargs[i] for i in params if i in kwargs} 
-    exemption_kwargs = get_kwargs(EXEMPTION_PARAMETERS)
-    deduction_kwargs = get_kwargs(DEDUCTION_PARAMETERS)
-    credit_kwargs = get_kwargs(CREDIT_PARAMETERS)
-    refund_kwargs = get_kwargs(REFUND_PARAMETERS)
-    get_incentives = lambda f, nums, kwargs: sum([f(i, **kwargs) for i in nums]) if nums else f(-1, **kwargs)
-    exemptions = get_incentives(determine_exemption_amount, 
-                                exemptions, 
-                                exemption_kwargs)
-    deductions = get_incentives(determine_deduction_amount, 
-                                deductions, 
-                                deduction_kwargs)
-    credits = get_incentives(determine_credit_amount, 
-                             credits, 
-                             credit_kwargs)
-    refunds = get_incentives(determine_refund_amount, 
-                             refunds, refund_kwargs)
-    return exemptions, deductions, credits, refunds
-
-get_incentive_parameters = lambda f: tuple(signature(f).parameters)[1:]
-EXEMPTION_PARAMETERS = get_incentive_parameters(determine_exemption_amount)
-DEDUCTION_PARAMETERS = get_incentive_parameters(determine_deduction_amount)
-CREDIT_PARAMETERS = get_incentive_parameters(determine_credit_amount)
-REFUND_PARAMETERS = get_incentive_parameters(determine_refund_amount)
\ No newline at end of file
+    # Check parameters once for all incentives; kwargs are shared
+    check_incentive_parameters(_EXEMPTION_HANDLERS, exemptions, kwargs)
+    check_incentive_parameters(_DEDUCTION_HANDLERS, deductions, kwargs)
+    check_incentive_parameters(_CREDIT_HANDLERS, credits, kwargs)
+    check_incentive_parameters(_REFUND_HANDLERS, refunds, kwargs)
+    incentives = np.zeros((4, plant_years), dtype=np.float64)
+    _fill_incentives(incentives[0], _EXEMPTION_HANDLERS, exemptions, plant_years, start, kwargs)
+    _fill_incentives(incentives[1], _DEDUCTION_HANDLERS, deductions, plant_years, start, kwargs)
+    _fill_incentives(incentives[2], _CREDIT_HANDLERS, credits, plant_years, start, kwargs)
+    _fill_incentives(incentives[3], _REFUND_HANDLERS, refunds, plant_years, start, kwargs)
+    return incentives
+
+EXEMPTION_PARAMETERS = ('value_added', 'property_taxable_value', 'property_tax_rate',
+                        'biodiesel_eq', 'ethanol_eq', 'fuel_taxable_value', 'fuel_tax_rate')
+DEDUCTION_PARAMETERS = ('NM_value', 'sales_taxable_value', 'sales_tax_rate')
+CREDIT_PARAMETERS = ('wages', 'TCI', 'state_income_tax_assessed', 'ethanol', 
+                     'fed_income_tax_assessed', 'property_tax_assessed', 
+                     'elec_eq', 'jobs_50', 'utility_tax_assessed')
+REFUND_PARAMETERS = ('IA_value', 'sales_tax_rate', 'sales_tax_assessed', 
+                     'building_mats', 'ethanol', 'state_income_tax_assessed')
+EXEMPTION_PARAMETERS_SET = frozenset(EXEMPTION_PARAMETERS)
+DEDUCTION_PARAMETERS_SET = frozenset(DEDUCTION_PARAMETERS)
+CREDIT_PARAMETERS_SET = frozenset(CREDIT_PARAMETERS)
+REFUND_PARAMETERS_SET = frozenset(REFUND_PARAMETERS)
\ No newline at end of file
@@ -0,0 +1,20 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Check that incentive handlers are registered consistently with their parameters.
+"""
+from inspect import signature
+from blocs.incentives import tax_incentives as ti
+
+def test_incentive_parameters():
+    for handlers, params in [(ti._EXEMPTION_HANDLERS, ti.EXEMPTION_PARAMETERS),
+                             (ti._DEDUCTION_HANDLERS, ti.DEDUCTION_PARAMETERS),
+                             (ti._CREDIT_HANDLERS, ti.CREDIT_PARAMETERS),
+                             (ti._REFUND_HANDLERS, ti.REFUND_PARAMETERS)]:
+        for f in handlers.values():
+            assert f.params == tuple(signature(f).parameters)[3:]
+        assert set(params) >= {i for f in handlers.values() for i in f.params}
+    assert set(ti._EXEMPTION_HANDLERS) == ti.EXEMPTIONS
+    assert set(ti._DEDUCTION_HANDLERS) == ti.DEDUCTIONS
+    assert set(ti._CREDIT_HANDLERS) == ti.CREDITS
+    assert set(ti._REFUND_HANDLERS) == ti.REFUNDS